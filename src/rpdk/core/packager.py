@@ -0,0 +1,154 @@
+"""Builds the zip packages that are uploaded when submitting a resource type.
+
+Packages are reproducible: entries are buffered and only written when the
+package is closed, sorted by name, with a fixed timestamp and normalised
+permissions. Identical inputs therefore produce byte-identical packages (and
+hashes), regardless of file modification times or the order plugins add files.
+"""
+import hashlib
+import logging
+import os
+import stat
+import zipfile
+from pathlib import Path
+
+LOG = logging.getLogger(__name__)
+
+# the earliest timestamp that can be represented in a zip file
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+# zip "version made by" value for Unix, so permissions are honoured everywhere
+CREATE_SYSTEM_UNIX = 3
+MSDOS_DIRECTORY_FLAG = 0x10
+HASH_CHUNK_SIZE = 64 * 1024
+
+
+class PackageStats:
+    def __init__(self, entries, content_size, size, sha256):
+        self.entries = entries
+        self.content_size = content_size
+        self.size = size
+        self.sha256 = sha256
+
+    def __str__(self):
+        return "{} entries, {} bytes ({} bytes uncompressed), sha256 {}".format(
+            self.entries, self.size, self.content_size, self.sha256
+        )
+
+
+def _normalise(zinfo):
+    """Strip any host-specific metadata from the entry.
+
+    Only the executable bit is kept, as some runtimes (e.g. ``go1.x``) require
+    the handler binary to be executable.
+    """
+    zinfo.date_time = ZIP_EPOCH
+    zinfo.create_system = CREATE_SYSTEM_UNIX
+    mode = zinfo.external_attr >> 16
+    if zinfo.is_dir():
+        zinfo.external_attr = ((stat.S_IFDIR | 0o755) << 16) | MSDOS_DIRECTORY_FLAG
+    elif mode & 0o111:
+        zinfo.external_attr = (stat.S_IFREG | 0o755) << 16
+    else:
+        zinfo.external_attr = (stat.S_IFREG | 0o644) << 16
+    return zinfo
+
+
+class ReproducibleZipFile(zipfile.ZipFile):
+    """A write-only zip file, whose contents only depend on the entries added.
+
+    :meth:`write` and :meth:`writestr` behave like their :class:`zipfile.ZipFile`
+    counterparts (a missing file still raises :exc:`FileNotFoundError`
+    immediately), but nothing is written until the zip file is closed.
+    Adding the same name twice replaces the earlier entry.
+    """
+
+    def __init__(self, file, compression=zipfile.ZIP_STORED):
+        super().__init__(file, mode="w", compression=compression)
+        self._pending = {}
+
+    def write(self, filename, arcname=None, compress_type=None, compresslevel=None):
+        # not ZipInfo.from_file, which rejects files modified before 1980
+        st = os.stat(filename)
+        if arcname is None:
+            arcname = filename
+        arcname = os.path.normpath(os.path.splitdrive(arcname)[1])
+        arcname = arcname.lstrip(os.sep + (os.altsep or ""))
+        if stat.S_ISDIR(st.st_mode):
+            arcname += "/"
+        zinfo = zipfile.ZipInfo(arcname, ZIP_EPOCH)
+        zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+        zinfo.file_size = 0 if zinfo.is_dir() else st.st_size
+        self._pending[zinfo.filename] = (
+            zinfo,
+            Path(filename),
+            compress_type,
+            compresslevel,
+        )
+
+    def writestr(self, zinfo_or_arcname, data, compress_type=None, compresslevel=None):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if isinstance(zinfo_or_arcname, zipfile.ZipInfo):
+            zinfo = zinfo_or_arcname
+        else:
+            zinfo = zipfile.ZipInfo(zinfo_or_arcname)
+            zinfo.compress_type = self.compression
+        zinfo.file_size = len(data)
+        self._pending[zinfo.filename] = (zinfo, data, compress_type, compresslevel)
+
+    def _write_pending(self):
+        for name in sorted(self._pending):
+            zinfo, source, compress_type, compresslevel = self._pending[name]
+            data = b"" if zinfo.is_dir() else source
+            if isinstance(data, Path):
+                data = data.read_bytes()
+            kwargs = {"compress_type": compress_type}
+            # compresslevel is only supported on Python 3.7+
+            if compresslevel is not None:
+                kwargs["compresslevel"] = compresslevel
+            super().writestr(_normalise(zinfo), data, **kwargs)
+        self._pending.clear()
+
+    def close(self):
+        if self.fp is not None:
+            self._write_pending()
+        super().close()
+
+
+def _hash_fileobj(fileobj, start, end):
+    sha256 = hashlib.sha256()
+    fileobj.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        chunk = fileobj.read(min(HASH_CHUNK_SIZE, remaining))
+        if not chunk:
+            break
+        sha256.update(chunk)
+        remaining -= len(chunk)
+    return sha256.hexdigest()
+
+
+def build_package(fileobj, add_entries, compression=zipfile.ZIP_STORED):
+    """Write a reproducible package to a readable, seekable file object.
+
+    ``add_entries`` is called with a :class:`ReproducibleZipFile` to populate
+    the package. Afterwards, the file object is rewound to the start of the
+    package, ready for upload.
+
+    :return: The :class:`PackageStats` of the package that was written.
+    """
+    start = fileobj.tell()
+    with ReproducibleZipFile(fileobj, compression=compression) as zip_file:
+        add_entries(zip_file)
+    end = fileobj.tell()
+
+    infolist = zip_file.infolist()
+    stats = PackageStats(
+        len(infolist),
+        sum(zinfo.file_size for zinfo in infolist),
+        end - start,
+        _hash_fileobj(fileobj, start, end),
+    )
+    fileobj.seek(start)
+    LOG.debug("Built package: %s", stats)
+    return stats
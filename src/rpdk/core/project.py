@@ -1,9 +1,8 @@
 import json
 import logging
 import shutil
-import zipfile
 from pathlib import Path
-from tempfile import TemporaryFile
+from tempfile import SpooledTemporaryFile
 from uuid import uuid4
 
 from botocore.exceptions import ClientError, WaiterError
@@ -21,8 +20,11 @@ from .exceptions import (
 )
 from .jsonutils.pointer import fragment_decode, fragment_encode
 from .jsonutils.utils import traverse
+from .packager import build_package
 from .plugin_registry import load_plugin
+from .status import wait_for_registration
 from .upload import Uploader
+from .waiters import AdaptivePoller
 
 LOG = logging.getLogger(__name__)
 
@@ -37,6 +39,8 @@ DEFAULT_ROLE_TIMEOUT_MINUTES = 120  # 2 hours
 # https://docs.aws.amazon.com/IAM/latest/APIReference/API_CreateRole.html
 MIN_ROLE_TIMEOUT_SECONDS = 3600  # 1 hour
 MAX_ROLE_TIMEOUT_SECONDS = 43200  # 12 hours
+# packages smaller than this are built in memory, larger ones spill to disk
+PACKAGE_SPOOL_MAX_SIZE = 64 * 1024 * 1024  # 64 MiB
 
 
 LAMBDA_RUNTIMES = {
@@ -311,37 +315,52 @@ class Project:  # pylint: disable=too-many-instance-attributes
             self._raise_invalid_project(msg, e)
 
     def submit(
-        self, dry_run, endpoint_url, region_name, role_arn, use_role, set_default
+        self,
+        dry_run,
+        endpoint_url,
+        region_name,
+        role_arn,
+        use_role,
+        set_default,
+        no_wait=False,
+        poller=None,
     ):  # pylint: disable=too-many-arguments
         # if it's a dry run, keep the file; otherwise can delete after upload
         if dry_run:
             path = Path("{}.zip".format(self.hypenated_name))
-            context_mgr = path.open("wb")
+            context_mgr = path.open("w+b")
         else:
-            context_mgr = TemporaryFile("w+b")
+            context_mgr = SpooledTemporaryFile(max_size=PACKAGE_SPOOL_MAX_SIZE)
 
         with context_mgr as f:
-            # the default compression is ZIP_STORED, which helps with the
-            # file-size check on upload
-            with zipfile.ZipFile(f, mode="w") as zip_file:
-                zip_file.write(self.schema_path, SCHEMA_UPLOAD_FILENAME)
-                zip_file.write(self.settings_path, SETTINGS_FILENAME)
-                try:
-                    zip_file.write(self.overrides_path, OVERRIDES_FILENAME)
-                    LOG.debug("%s found. Writing to package.", OVERRIDES_FILENAME)
-                except FileNotFoundError:
-                    LOG.debug(
-                        "%s not found. Not writing to package.", OVERRIDES_FILENAME
-                    )
-                self._plugin.package(self, zip_file)
+            stats = build_package(f, self._package)
+            LOG.warning("Package: %s", stats)
 
             if dry_run:
                 LOG.error("Dry run complete: %s", path.resolve())
-            else:
-                f.seek(0)
-                self._upload(
-                    f, endpoint_url, region_name, role_arn, use_role, set_default
-                )
+                return None
+            return self._upload(
+                f,
+                endpoint_url,
+                region_name,
+                role_arn,
+                use_role,
+                set_default,
+                no_wait,
+                poller,
+            )
+
+    def _package(self, zip_file):
+        # the default compression is ZIP_STORED, which helps with the
+        # file-size check on upload
+        zip_file.write(self.schema_path, SCHEMA_UPLOAD_FILENAME)
+        zip_file.write(self.settings_path, SETTINGS_FILENAME)
+        try:
+            zip_file.write(self.overrides_path, OVERRIDES_FILENAME)
+            LOG.debug("%s found. Writing to package.", OVERRIDES_FILENAME)
+        except FileNotFoundError:
+            LOG.debug("%s not found. Not writing to package.", OVERRIDES_FILENAME)
+        self._plugin.package(self, zip_file)
 
     def generate_docs(self):
         # generate the docs folder that contains documentation based on the schema
@@ -480,14 +499,24 @@ class Project:  # pylint: disable=too-many-instance-attributes
         return prop
 
     def _upload(
-        self, fileobj, endpoint_url, region_name, role_arn, use_role, set_default
+        self,
+        fileobj,
+        endpoint_url,
+        region_name,
+        role_arn,
+        use_role,
+        set_default,
+        no_wait=False,
+        poller=None,
     ):  # pylint: disable=too-many-arguments, too-many-locals
         LOG.debug("Packaging complete, uploading...")
         session = create_sdk_session(region_name)
         LOG.debug("Uploading to region '%s'", session.region_name)
         cfn_client = session.client("cloudformation", endpoint_url=endpoint_url)
         s3_client = session.client("s3")
-        uploader = Uploader(cfn_client, s3_client)
+        if poller is None:
+            poller = AdaptivePoller()
+        uploader = Uploader(cfn_client, s3_client, poller)
         if use_role and not role_arn and "handlers" in self.schema:
             LOG.debug("Creating execution role for provider to use")
             role_arn = uploader.create_or_update_role(
@@ -517,46 +546,41 @@ class Project:  # pylint: disable=too-many-instance-attributes
         except ClientError as e:
             LOG.debug("Registering type resulted in unknown ClientError", exc_info=e)
             raise DownstreamError("Unknown CloudFormation error") from e
+
+        registration_token = response["RegistrationToken"]
+        if no_wait:
+            LOG.warning(
+                "Successfully submitted type with registration token '%s'. "
+                "Use 'cfn status' to check the progress of the registration.",
+                registration_token,
+            )
         else:
             self._wait_for_registration(
-                cfn_client, response["RegistrationToken"], set_default
+                cfn_client, registration_token, set_default, poller
             )
+        LOG.info("Spent %.1f seconds waiting in total", poller.total_elapsed)
+        return registration_token
 
     @staticmethod
-    def _wait_for_registration(cfn_client, registration_token, set_default):
-        registration_waiter = cfn_client.get_waiter("type_registration_complete")
+    def _wait_for_registration(cfn_client, registration_token, set_default, poller):
         try:
             LOG.warning(
                 "Successfully submitted type. "
                 "Waiting for registration with token '%s' to complete.",
                 registration_token,
             )
-            registration_waiter.wait(RegistrationToken=registration_token)
+            response = wait_for_registration(cfn_client, registration_token, poller)
         except WaiterError as e:
             LOG.warning(
                 "Failed to register the type with registration token '%s'.",
                 registration_token,
             )
-            try:
-                response = cfn_client.describe_type_registration(
-                    RegistrationToken=registration_token
-                )
-            except ClientError as describe_error:
-                LOG.debug(
-                    "Describing type registration resulted in unknown ClientError",
-                    exc_info=e,
-                )
-                raise DownstreamError(
-                    "Error describing type registration"
-                ) from describe_error
             LOG.warning(
-                "Please see response for additional information: '%s'", response
+                "Please see response for additional information: '%s'",
+                e.last_response,
             )
             raise DownstreamError("Type registration error") from e
         LOG.warning("Registration complete.")
-        response = cfn_client.describe_type_registration(
-            RegistrationToken=registration_token
-        )
         LOG.warning(response)
         if set_default:
             arn = response["TypeVersionArn"]
@@ -0,0 +1,152 @@
+"""This sub command shows the status of one or more type registrations.
+
+Registration tokens are returned by the 'submit' sub command.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore.exceptions import ClientError, WaiterError
+
+from .boto_helpers import create_sdk_session
+from .exceptions import DownstreamError, SysExitRecommendedError
+from .waiters import DEFAULT_MAX_DELAY, DEFAULT_TIMEOUT, AdaptivePoller, PollState
+
+LOG = logging.getLogger(__name__)
+
+REGISTRATION_COMPLETE = "COMPLETE"
+REGISTRATION_FAILED = "FAILED"
+TERMINAL_STATUSES = frozenset({REGISTRATION_COMPLETE, REGISTRATION_FAILED})
+
+DEFAULT_MAX_WORKERS = 10
+
+
+def describe_registration(cfn_client, registration_token):
+    try:
+        return cfn_client.describe_type_registration(
+            RegistrationToken=registration_token
+        )
+    except ClientError as e:
+        LOG.debug(
+            "Describing type registration resulted in unknown ClientError",
+            exc_info=e,
+        )
+        raise DownstreamError("Error describing type registration") from e
+
+
+def wait_for_registration(cfn_client, registration_token, poller=None):
+    """Poll a registration until it is complete.
+
+    :raises botocore.exceptions.WaiterError: if the registration failed, or
+        did not complete before the poller's timeout.
+    """
+    if poller is None:
+        poller = AdaptivePoller()
+
+    def _poll():
+        response = describe_registration(cfn_client, registration_token)
+        progress_status = response["ProgressStatus"]
+        if progress_status == REGISTRATION_COMPLETE:
+            return PollState.DONE, response
+        if progress_status == REGISTRATION_FAILED:
+            raise WaiterError(
+                name=registration_token,
+                reason="Waiter encountered a terminal failure state",
+                last_response=response,
+            )
+        LOG.info("Registration '%s' is %s", registration_token, progress_status)
+        return PollState.PENDING, response
+
+    return poller.wait(_poll, registration_token)
+
+
+def get_registrations(
+    cfn_client, registration_tokens, poller=None, max_workers=DEFAULT_MAX_WORKERS
+):
+    """Describe several registrations concurrently. If a poller is given,
+    wait for all registrations to complete or fail, or the poller's timeout.
+
+    :return: A mapping of registration tokens to their (last) describe responses.
+    """
+
+    def _get(registration_token):
+        if poller is None:
+            return describe_registration(cfn_client, registration_token)
+        try:
+            return wait_for_registration(cfn_client, registration_token, poller)
+        except WaiterError as e:
+            return e.last_response
+
+    # dictionaries are used to de-duplicate tokens, while preserving order
+    tokens = list(dict.fromkeys(registration_tokens))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(tokens, executor.map(_get, tokens)))
+
+
+def status(args):
+    session = create_sdk_session(args.region)
+    cfn_client = session.client("cloudformation", endpoint_url=args.endpoint_url)
+
+    poller = None
+    if args.wait:
+        poller = AdaptivePoller(max_delay=args.max_poll_delay, timeout=args.timeout)
+    registrations = get_registrations(
+        cfn_client, args.registration_tokens, poller, args.max_workers
+    )
+
+    failed = False
+    for registration_token, response in registrations.items():
+        progress_status = response["ProgressStatus"]
+        details = response.get("TypeVersionArn") or response.get("Description", "")
+        print(registration_token, progress_status, details, sep="\t")
+        failed = failed or progress_status == REGISTRATION_FAILED
+
+    if failed:
+        raise SysExitRecommendedError("One or more registrations failed")
+    if args.wait and not all(
+        response["ProgressStatus"] in TERMINAL_STATUSES
+        for response in registrations.values()
+    ):
+        raise SysExitRecommendedError("Timed out waiting for registrations")
+
+
+def setup_subparser(subparsers, parents):
+    # see docstring of this file
+    parser = subparsers.add_parser("status", description=__doc__, parents=parents)
+    parser.set_defaults(command=status)
+
+    parser.add_argument(
+        "registration_tokens",
+        nargs="+",
+        metavar="registration-token",
+        help="Registration tokens returned by 'submit'.",
+    )
+    parser.add_argument("--endpoint-url", help="CloudFormation endpoint to use.")
+    parser.add_argument(
+        "--region", help="AWS Region the resource types were submitted to."
+    )
+    parser.add_argument(
+        "--wait",
+        action="store_true",
+        help="Wait for all registrations to complete or fail.",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=DEFAULT_TIMEOUT,
+        help="Maximum number of seconds to wait for registrations "
+        f"(Default: {DEFAULT_TIMEOUT}).",
+    )
+    parser.add_argument(
+        "--max-poll-delay",
+        type=float,
+        default=DEFAULT_MAX_DELAY,
+        help="Maximum number of seconds between polls while waiting "
+        f"(Default: {DEFAULT_MAX_DELAY}).",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help="Maximum number of registrations to query concurrently "
+        f"(Default: {DEFAULT_MAX_WORKERS}).",
+    )
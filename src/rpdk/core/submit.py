@@ -5,6 +5,7 @@ Projects can be created via the 'init' sub command.
 import logging
 
 from .project import Project
+from .waiters import DEFAULT_MAX_DELAY, DEFAULT_TIMEOUT, AdaptivePoller
 
 LOG = logging.getLogger(__name__)
 
@@ -12,14 +13,19 @@ LOG = logging.getLogger(__name__)
 def submit(args):
     project = Project()
     project.load()
-    project.submit(
+    registration_token = project.submit(
         args.dry_run,
         args.endpoint_url,
         args.region,
         args.role_arn,
         args.use_role,
         args.set_default,
+        args.no_wait,
+        AdaptivePoller(max_delay=args.max_poll_delay, timeout=args.wait_timeout),
     )
+    if args.no_wait and registration_token:
+        # printed on its own, so it is easy to capture in scripts
+        print(registration_token)
 
 
 def setup_subparser(subparsers, parents):
@@ -32,11 +38,32 @@ def setup_subparser(subparsers, parents):
     )
     parser.add_argument("--endpoint-url", help="CloudFormation endpoint to use.")
     parser.add_argument("--region", help="AWS Region to submit the resource type.")
-    parser.add_argument(
+    wait_group = parser.add_mutually_exclusive_group()
+    wait_group.add_argument(
         "--set-default",
         action="store_true",
         help="If registration is successful, set submitted version to the default.",
     )
+    wait_group.add_argument(
+        "--no-wait",
+        action="store_true",
+        help="Print the registration token and exit without waiting for the "
+        "registration to complete. Use 'status' to check on it later.",
+    )
+    parser.add_argument(
+        "--wait-timeout",
+        type=int,
+        default=DEFAULT_TIMEOUT,
+        help="Maximum number of seconds to wait for each stack update and the "
+        f"registration (Default: {DEFAULT_TIMEOUT}).",
+    )
+    parser.add_argument(
+        "--max-poll-delay",
+        type=float,
+        default=DEFAULT_MAX_DELAY,
+        help="Maximum number of seconds between polls while waiting "
+        f"(Default: {DEFAULT_MAX_DELAY}).",
+    )
     role_group = parser.add_mutually_exclusive_group()
     role_group.add_argument(
         "--role-arn",
@@ -1,10 +1,12 @@
 import logging
 from datetime import datetime
+from uuid import uuid4
 
 from botocore.exceptions import ClientError, WaiterError
 
 from .data_loaders import resource_stream
 from .exceptions import DownstreamError, InternalError, InvalidProjectError, UploadError
+from .waiters import AdaptivePoller, PollState
 
 LOG = logging.getLogger(__name__)
 
@@ -12,12 +14,26 @@ BUCKET_OUTPUT_NAME = "CloudFormationManagedUploadBucketName"
 LOG_DELIVERY_ROLE_ARN_OUTPUT_NAME = "LogAndMetricsDeliveryRoleArn"
 EXECUTION_ROLE_ARN_OUTPUT_NAME = "ExecutionRoleArn"
 INFRA_STACK_NAME = "CloudFormationManagedUploadInfrastructure"
+STACK_RESOURCE_TYPE = "AWS::CloudFormation::Stack"
+
+
+def _check_stack_status(stack_id, stack_status, success_status, response):
+    if stack_status == success_status:
+        return PollState.DONE
+    if stack_status.endswith("_IN_PROGRESS"):
+        return PollState.PENDING
+    raise WaiterError(
+        name=stack_id,
+        reason="Stack reached terminal status '{}'".format(stack_status),
+        last_response=response,
+    )
 
 
 class Uploader:
-    def __init__(self, cfn_client, s3_client):
+    def __init__(self, cfn_client, s3_client, poller=None):
         self.cfn_client = cfn_client
         self.s3_client = s3_client
+        self.poller = poller or AdaptivePoller()
         self.bucket_name = ""
         self.log_delivery_role_arn = ""
 
@@ -41,14 +57,76 @@ class Uploader:
 
         return template
 
-    def _wait_for_stack(self, stack_id, waiter_name, success_msg):
-        waiter = self.cfn_client.get_waiter(waiter_name)
+    def _poll_stack_events(self, stack_id, success_status, token, seen_event_ids):
+        """Check the stack events caused by the operation with the given token.
+
+        Only the first page of events is needed, since they are returned newest
+        first, and the stack's own terminal event is always the last one.
+        """
+        response = self.cfn_client.describe_stack_events(StackName=stack_id)
+        new_events = [
+            event
+            for event in response["StackEvents"]
+            if event.get("ClientRequestToken") == token
+            and event["EventId"] not in seen_event_ids
+        ]
+        if not new_events:
+            return PollState.PENDING, response
+
+        state = PollState.PROGRESS
+        for event in reversed(new_events):
+            seen_event_ids.add(event["EventId"])
+            LOG.debug(
+                "%s %s: %s",
+                event["LogicalResourceId"],
+                event["ResourceStatus"],
+                event.get("ResourceStatusReason", ""),
+            )
+            is_stack = (
+                event["ResourceType"] == STACK_RESOURCE_TYPE
+                and event.get("PhysicalResourceId") == event["StackId"]
+            )
+            if is_stack:
+                stack_state = _check_stack_status(
+                    stack_id, event["ResourceStatus"], success_status, response
+                )
+                if stack_state == PollState.DONE:
+                    state = stack_state
+        return state, response
+
+    def _poll_stack_status(self, stack_id, success_status):
+        response = self.cfn_client.describe_stacks(StackName=stack_id)
+        stack_status = response["Stacks"][0]["StackStatus"]
+        return (
+            _check_stack_status(stack_id, stack_status, success_status, response),
+            response,
+        )
+
+    def _wait_for_stack(self, stack_id, success_status, success_msg, token=None):
         LOG.debug("Waiting for stack '%s'", stack_id)
+        seen_event_ids = set()
+        use_events = token is not None
+
+        def _poll():
+            nonlocal use_events
+            if use_events:
+                try:
+                    return self._poll_stack_events(
+                        stack_id, success_status, token, seen_event_ids
+                    )
+                except ClientError as e:
+                    LOG.debug(
+                        "Describing events for stack '%s' failed, "
+                        "falling back to describing the stack",
+                        stack_id,
+                        exc_info=e,
+                    )
+                    use_events = False
+            return self._poll_stack_status(stack_id, success_status)
+
         try:
-            waiter.wait(
-                StackName=stack_id, WaiterConfig={"Delay": 5, "MaxAttempts": 200}
-            )
-        except WaiterError as e:
+            self.poller.wait(_poll, stack_id)
+        except (WaiterError, ClientError) as e:
             LOG.debug("Waiter failed for stack '%s'", stack_id, exc_info=e)
             LOG.critical(
                 "Failed to create or update the '%s' stack. "
@@ -86,17 +164,21 @@ class Uploader:
         args = {"StackName": stack_name, "TemplateBody": template}
         # attempt to create stack. if the stack already exists, try to update it
         LOG.info("Creating %s", stack_name)
+        # the token identifies the stack events caused by this operation
+        token = str(uuid4())
         try:
             result = self.cfn_client.create_stack(
                 **args,
                 EnableTerminationProtection=True,
                 Capabilities=["CAPABILITY_IAM"],
+                ClientRequestToken=token,
             )
         except self.cfn_client.exceptions.AlreadyExistsException:
             LOG.info("%s already exists. " "Attempting to update", stack_name)
+            token = str(uuid4())
             try:
                 result = self.cfn_client.update_stack(
-                    **args, Capabilities=["CAPABILITY_IAM"]
+                    **args, Capabilities=["CAPABILITY_IAM"], ClientRequestToken=token
                 )
             except ClientError as e:
                 # if the update is a noop, don't do anything else
@@ -115,8 +197,9 @@ class Uploader:
                 stack_id = result["StackId"]
                 self._wait_for_stack(
                     stack_id,
-                    "stack_update_complete",
+                    "UPDATE_COMPLETE",
                     "{} stack is up to date".format(stack_name),
+                    token,
                 )
         except ClientError as e:
             LOG.debug(
@@ -129,8 +212,9 @@ class Uploader:
             stack_id = result["StackId"]
             self._wait_for_stack(
                 stack_id,
-                "stack_create_complete",
+                "CREATE_COMPLETE",
                 "{} stack was successfully created".format(stack_name),
+                token,
             )
 
         return stack_id
@@ -0,0 +1,110 @@
+"""Adaptive polling, shared by the stack and type registration waiters.
+
+botocore's waiters poll with a fixed delay, so quick operations still wait for
+the full delay, while long operations make many needless calls. Instead, the
+delay starts short and grows exponentially (with jitter, so concurrent waiters
+don't poll in lockstep), up to a maximum. Whenever a poll observes progress
+(e.g. new stack events), the delay is reset, as the operation is likely to
+finish soon.
+"""
+import logging
+import random
+from enum import Enum, auto
+from time import monotonic, sleep
+
+from botocore.exceptions import WaiterError
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_INITIAL_DELAY = 1
+DEFAULT_MAX_DELAY = 30
+DEFAULT_BACKOFF = 2
+DEFAULT_JITTER = 0.2
+DEFAULT_TIMEOUT = 60 * 60  # 1 hour
+
+
+class PollState(Enum):
+    #: the operation is still running, and nothing has changed
+    PENDING = auto()
+    #: the operation is still running, but has made progress
+    PROGRESS = auto()
+    #: the operation has finished successfully
+    DONE = auto()
+
+
+class WaitMetrics:
+    def __init__(self, name):
+        self.name = name
+        self.polls = 0
+        self.elapsed = 0.0
+        self.slept = 0.0
+
+    def __str__(self):
+        return "{}: {} polls in {:.1f} seconds ({:.1f} seconds sleeping)".format(
+            self.name, self.polls, self.elapsed, self.slept
+        )
+
+
+class AdaptivePoller:
+    def __init__(
+        self,
+        initial_delay=DEFAULT_INITIAL_DELAY,
+        max_delay=DEFAULT_MAX_DELAY,
+        backoff=DEFAULT_BACKOFF,
+        jitter=DEFAULT_JITTER,
+        timeout=DEFAULT_TIMEOUT,
+    ):  # pylint: disable=too-many-arguments
+        self.initial_delay = min(initial_delay, max_delay)
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.jitter = jitter
+        self.timeout = timeout
+        self.metrics = []
+
+    @property
+    def total_elapsed(self):
+        return sum(metrics.elapsed for metrics in self.metrics)
+
+    def _jittered(self, delay):
+        # not used for security/cryptographic purposes
+        return delay * random.uniform(1 - self.jitter, 1)  # nosec
+
+    def wait(self, poll, name):
+        """Call ``poll`` until the operation is done, and return its response.
+
+        ``poll`` is called without arguments, and must return a tuple of
+        ``(PollState, response)``. For terminal failures, ``poll`` should raise
+        :exc:`botocore.exceptions.WaiterError`.
+
+        :raises botocore.exceptions.WaiterError: if the timeout expires.
+        """
+        metrics = WaitMetrics(name)
+        self.metrics.append(metrics)
+        start = monotonic()
+        deadline = start + self.timeout
+        delay = self.initial_delay
+        try:
+            while True:
+                metrics.polls += 1
+                state, response = poll()
+                if state == PollState.DONE:
+                    return response
+
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    raise WaiterError(
+                        name=name,
+                        reason="Max wait time exceeded",
+                        last_response=response,
+                    )
+
+                if state == PollState.PROGRESS:
+                    delay = self.initial_delay
+                seconds = min(self._jittered(delay), remaining)
+                LOG.debug("Waiting %.1f seconds for %s", seconds, name)
+                sleep(seconds)
+                metrics.slept += seconds
+                delay = min(delay * self.backoff, self.max_delay)
+        finally:
+            metrics.elapsed = monotonic() - start
+            LOG.info("Waited for %s", metrics)
@@ -0,0 +1,106 @@
+import hashlib
+import os
+import stat
+import zipfile
+from io import BytesIO
+
+import pytest
+
+from rpdk.core.packager import ZIP_EPOCH, ReproducibleZipFile, build_package
+
+from .utils import CONTENTS_UTF8
+
+
+@pytest.fixture
+def files(tmp_path):
+    schema = tmp_path / "schema.json"
+    schema.write_text(CONTENTS_UTF8, encoding="utf-8")
+    handler = tmp_path / "handler"
+    handler.write_bytes(b"\x7fELF")
+    handler.chmod(0o755)
+    return schema, handler
+
+
+def _build(add_entries):
+    fileobj = BytesIO()
+    stats = build_package(fileobj, add_entries)
+    return fileobj, stats
+
+
+def test_build_package_is_reproducible(files):
+    schema, handler = files
+
+    def add_entries(zip_file):
+        zip_file.write(schema, "schema.json")
+        zip_file.write(handler, "bootstrap")
+        zip_file.writestr("config.json", "{}")
+
+    def add_entries_reversed(zip_file):
+        zip_file.writestr("config.json", "{}")
+        zip_file.write(handler, "bootstrap")
+        zip_file.write(schema, "schema.json")
+
+    first, first_stats = _build(add_entries)
+    os.utime(schema, (0, 0))
+    second, second_stats = _build(add_entries_reversed)
+
+    assert first.getvalue() == second.getvalue()
+    assert first_stats.sha256 == second_stats.sha256
+    assert first_stats.sha256 == hashlib.sha256(first.getvalue()).hexdigest()
+
+
+def test_build_package_entries_sorted_and_normalised(files):
+    schema, handler = files
+
+    def add_entries(zip_file):
+        zip_file.write(schema, "schema.json")
+        zip_file.write(handler, "bootstrap")
+        zip_file.writestr("lib/", b"")
+
+    fileobj, _stats = _build(add_entries)
+
+    with zipfile.ZipFile(fileobj) as zip_file:
+        assert zip_file.namelist() == ["bootstrap", "lib/", "schema.json"]
+        infos = {info.filename: info for info in zip_file.infolist()}
+        assert zip_file.testzip() is None
+        assert zip_file.read("schema.json").decode("utf-8") == CONTENTS_UTF8
+
+    assert all(info.date_time == ZIP_EPOCH for info in infos.values())
+    assert stat.S_IMODE(infos["bootstrap"].external_attr >> 16) == 0o755
+    assert stat.S_IMODE(infos["schema.json"].external_attr >> 16) == 0o644
+    assert infos["lib/"].is_dir()
+
+
+def test_build_package_stats(files):
+    schema, _handler = files
+
+    def add_entries(zip_file):
+        zip_file.write(schema, "schema.json")
+        zip_file.writestr("config.json", "{}")
+
+    fileobj, stats = _build(add_entries)
+
+    assert stats.entries == 2
+    assert stats.content_size == len(CONTENTS_UTF8.encode("utf-8")) + 2
+    assert stats.size == len(fileobj.getvalue())
+    assert fileobj.tell() == 0  # rewound for upload
+    assert str(stats.size) in str(stats)
+
+
+def test_build_package_duplicate_name_replaces_entry():
+    def add_entries(zip_file):
+        zip_file.writestr("config.json", "old")
+        zip_file.writestr("config.json", "new")
+
+    fileobj, stats = _build(add_entries)
+
+    assert stats.entries == 1
+    with zipfile.ZipFile(fileobj) as zip_file:
+        assert zip_file.read("config.json") == b"new"
+
+
+def test_reproducible_zip_file_write_missing_file(tmp_path):
+    with ReproducibleZipFile(BytesIO()) as zip_file:
+        with pytest.raises(FileNotFoundError):
+            zip_file.write(tmp_path / "missing.json", "missing.json")
+        assert zip_file.namelist() == []
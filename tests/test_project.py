@@ -25,6 +25,7 @@ from rpdk.core.plugin_base import LanguagePlugin
 from rpdk.core.project import (
     LAMBDA_RUNTIMES,
     OVERRIDES_FILENAME,
+    PACKAGE_SPOOL_MAX_SIZE,
     SCHEMA_UPLOAD_FILENAME,
     SETTINGS_FILENAME,
     Project,
@@ -32,6 +33,7 @@ from rpdk.core.project import (
 )
 from rpdk.core.test import empty_override
 from rpdk.core.upload import Uploader
+from rpdk.core.waiters import AdaptivePoller
 
 from .utils import CONTENTS_UTF8, UnclosingBytesIO
 
@@ -53,6 +55,10 @@ DESCRIBE_TYPE_COMPLETE_RETURN = {
     "Description": "Some detailed progress message.",
     "ProgressStatus": "COMPLETE",
 }
+DESCRIBE_TYPE_IN_PROGRESS_RETURN = {
+    "Description": "Some detailed progress message.",
+    "ProgressStatus": "IN_PROGRESS",
+}
 DESCRIBE_TYPE_FAILED_RETURN = {
     "Description": "Some detailed progress message.",
     "ProgressStatus": "FAILED",
@@ -506,7 +512,7 @@ def test_submit_dry_run(project):
     patch_plugin = patch.object(project, "_plugin", spec=LanguagePlugin)
     patch_upload = patch.object(project, "_upload", autospec=True)
     patch_path = patch("rpdk.core.project.Path", return_value=zip_path)
-    patch_temp = patch("rpdk.core.project.TemporaryFile", autospec=True)
+    patch_temp = patch("rpdk.core.project.SpooledTemporaryFile", autospec=True)
 
     # fmt: off
     # these context managers can't be wrapped by black, but it removes the \
@@ -558,7 +564,7 @@ def test_submit_live_run(project):
     patch_plugin = patch.object(project, "_plugin", spec=LanguagePlugin)
     patch_upload = patch.object(project, "_upload", autospec=True)
     patch_path = patch("rpdk.core.project.Path", autospec=True)
-    patch_temp = patch("rpdk.core.project.TemporaryFile", return_value=temp_file)
+    patch_temp = patch("rpdk.core.project.SpooledTemporaryFile", return_value=temp_file)
 
     # fmt: off
     # these context managers can't be wrapped by black, but it removes the \
@@ -575,7 +581,7 @@ def test_submit_live_run(project):
     # fmt: on
 
     mock_path.assert_not_called()
-    mock_temp.assert_called_once_with("w+b")
+    mock_temp.assert_called_once_with(max_size=PACKAGE_SPOOL_MAX_SIZE)
     mock_plugin.package.assert_called_once_with(project, ANY)
 
     # zip file construction is tested by the dry-run test
@@ -588,6 +594,8 @@ def test_submit_live_run(project):
         role_arn=None,
         use_role=True,
         set_default=True,
+        no_wait=False,
+        poller=None,
     )
 
     assert temp_file._was_closed
@@ -643,7 +651,7 @@ def test__upload_good_path_create_role_and_set_default(project):
         },
         ExecutionRoleArn="some-execution-role-arn",
     )
-    mock_wait.assert_called_once_with(mock_cfn_client, "foo", True)
+    mock_wait.assert_called_once_with(mock_cfn_client, "foo", True, ANY)
 
 
 @pytest.mark.parametrize(
@@ -684,7 +692,7 @@ def test__upload_good_path_skip_role_creation(
     mock_upload_method.assert_called_once_with(project.hypenated_name, fileobj)
     mock_role_arn_method.assert_called_once_with()
     mock_uuid.assert_called_once_with()
-    mock_wait.assert_called_once_with(mock_cfn_client, "foo", True)
+    mock_wait.assert_called_once_with(mock_cfn_client, "foo", True, ANY)
 
     mock_cfn_client.register_type.assert_called_once_with(
         Type="RESOURCE",
@@ -745,17 +753,53 @@ def test__upload_clienterror(project):
     )
 
 
-def test__wait_for_registration_set_default(project):
+def test__upload_no_wait(project):
+    project.type_name = TYPE_NAME
+    project.schema = {}
+
+    mock_cfn_client = MagicMock(spec=["register_type"])
+    mock_cfn_client.register_type.return_value = {"RegistrationToken": "foo"}
+    fileobj = object()
+
+    patch_sdk = patch("rpdk.core.project.create_sdk_session", autospec=True)
+    patch_uploader = patch.object(Uploader, "upload", return_value="url")
+    patch_role_arn = patch.object(
+        Uploader, "get_log_delivery_role_arn", return_value="some-log-role-arn"
+    )
+    patch_wait = patch.object(project, "_wait_for_registration", autospec=True)
+
+    with patch_sdk as mock_sdk, patch_uploader, patch_role_arn, patch_wait as mock_wait:
+        mock_sdk.return_value.client.side_effect = [mock_cfn_client, MagicMock()]
+        registration_token = project._upload(
+            fileobj,
+            endpoint_url=None,
+            region_name=None,
+            role_arn=None,
+            use_role=False,
+            set_default=False,
+            no_wait=True,
+        )
+
+    assert registration_token == "foo"
+    mock_cfn_client.register_type.assert_called_once()
+    mock_wait.assert_not_called()
+
+
+@pytest.fixture
+def poller():
+    with patch("rpdk.core.waiters.sleep", autospec=True):
+        yield AdaptivePoller()
+
+
+def test__wait_for_registration_set_default(project, poller):
     mock_cfn_client = MagicMock(
-        spec=["describe_type_registration", "set_type_default_version", "get_waiter"]
+        spec=["describe_type_registration", "set_type_default_version"]
     )
     mock_cfn_client.describe_type_registration.return_value = (
         DESCRIBE_TYPE_COMPLETE_RETURN
     )
-    mock_waiter = MagicMock(spec=["wait"])
-    mock_cfn_client.get_waiter.return_value = mock_waiter
 
-    project._wait_for_registration(mock_cfn_client, REGISTRATION_TOKEN, True)
+    project._wait_for_registration(mock_cfn_client, REGISTRATION_TOKEN, True, poller)
 
     mock_cfn_client.describe_type_registration.assert_called_once_with(
         RegistrationToken=REGISTRATION_TOKEN
@@ -763,12 +807,11 @@ def test__wait_for_registration_set_default(project):
     mock_cfn_client.set_type_default_version.assert_called_once_with(
         Arn=TYPE_VERSION_ARN
     )
-    mock_waiter.wait.assert_called_once_with(RegistrationToken=REGISTRATION_TOKEN)
 
 
-def test__wait_for_registration_set_default_fails(project):
+def test__wait_for_registration_set_default_fails(project, poller):
     mock_cfn_client = MagicMock(
-        spec=["describe_type_registration", "set_type_default_version", "get_waiter"]
+        spec=["describe_type_registration", "set_type_default_version"]
     )
     mock_cfn_client.describe_type_registration.return_value = (
         DESCRIBE_TYPE_COMPLETE_RETURN
@@ -776,11 +819,11 @@ def test__wait_for_registration_set_default_fails(project):
     mock_cfn_client.set_type_default_version.side_effect = ClientError(
         BLANK_CLIENT_ERROR, "SetTypeDefaultVersion"
     )
-    mock_waiter = MagicMock(spec=["wait"])
-    mock_cfn_client.get_waiter.return_value = mock_waiter
 
     with pytest.raises(DownstreamError):
-        project._wait_for_registration(mock_cfn_client, REGISTRATION_TOKEN, True)
+        project._wait_for_registration(
+            mock_cfn_client, REGISTRATION_TOKEN, True, poller
+        )
 
     mock_cfn_client.describe_type_registration.assert_called_once_with(
         RegistrationToken=REGISTRATION_TOKEN
@@ -788,77 +831,61 @@ def test__wait_for_registration_set_default_fails(project):
     mock_cfn_client.set_type_default_version.assert_called_once_with(
         Arn=TYPE_VERSION_ARN
     )
-    mock_waiter.wait.assert_called_once_with(RegistrationToken=REGISTRATION_TOKEN)
 
 
-def test__wait_for_registration_no_set_default(project):
+def test__wait_for_registration_no_set_default(project, poller):
     mock_cfn_client = MagicMock(
-        spec=["describe_type_registration", "set_type_default_version", "get_waiter"]
+        spec=["describe_type_registration", "set_type_default_version"]
     )
-    mock_cfn_client.describe_type_registration.return_value = (
-        DESCRIBE_TYPE_COMPLETE_RETURN
-    )
-    mock_waiter = MagicMock(spec=["wait"])
-    mock_cfn_client.get_waiter.return_value = mock_waiter
+    mock_cfn_client.describe_type_registration.side_effect = [
+        DESCRIBE_TYPE_IN_PROGRESS_RETURN,
+        DESCRIBE_TYPE_COMPLETE_RETURN,
+    ]
 
-    project._wait_for_registration(mock_cfn_client, REGISTRATION_TOKEN, False)
+    project._wait_for_registration(mock_cfn_client, REGISTRATION_TOKEN, False, poller)
 
-    mock_cfn_client.describe_type_registration.assert_called_once_with(
-        RegistrationToken=REGISTRATION_TOKEN
-    )
+    assert mock_cfn_client.describe_type_registration.call_count == 2
     mock_cfn_client.set_type_default_version.assert_not_called()
-    mock_waiter.wait.assert_called_once_with(RegistrationToken=REGISTRATION_TOKEN)
+    assert poller.metrics[0].polls == 2
 
 
-def test__wait_for_registration_waiter_fails(project):
+def test__wait_for_registration_waiter_fails(project, poller):
     mock_cfn_client = MagicMock(
-        spec=["describe_type_registration", "set_type_default_version", "get_waiter"]
+        spec=["describe_type_registration", "set_type_default_version"]
     )
     mock_cfn_client.describe_type_registration.return_value = (
         DESCRIBE_TYPE_FAILED_RETURN
     )
-    mock_waiter = MagicMock(spec=["wait"])
-    mock_waiter.wait.side_effect = WaiterError(
-        "TypeRegistrationComplete",
-        "Waiter encountered a terminal failure state",
-        DESCRIBE_TYPE_FAILED_RETURN,
-    )
-    mock_cfn_client.get_waiter.return_value = mock_waiter
 
-    with pytest.raises(DownstreamError):
-        project._wait_for_registration(mock_cfn_client, REGISTRATION_TOKEN, True)
+    with pytest.raises(DownstreamError) as excinfo:
+        project._wait_for_registration(
+            mock_cfn_client, REGISTRATION_TOKEN, True, poller
+        )
 
+    assert isinstance(excinfo.value.__cause__, WaiterError)
     mock_cfn_client.describe_type_registration.assert_called_once_with(
         RegistrationToken=REGISTRATION_TOKEN
     )
     mock_cfn_client.set_type_default_version.assert_not_called()
-    mock_waiter.wait.assert_called_once_with(RegistrationToken=REGISTRATION_TOKEN)
 
 
-def test__wait_for_registration_waiter_fails_describe_fails(project):
+def test__wait_for_registration_describe_fails(project, poller):
     mock_cfn_client = MagicMock(
-        spec=["describe_type_registration", "set_type_default_version", "get_waiter"]
+        spec=["describe_type_registration", "set_type_default_version"]
     )
     mock_cfn_client.describe_type_registration.side_effect = ClientError(
         BLANK_CLIENT_ERROR, "DescribeTypeRegistration"
     )
-    mock_waiter = MagicMock(spec=["wait"])
-    mock_waiter.wait.side_effect = WaiterError(
-        "TypeRegistrationComplete",
-        "Waiter encountered a terminal failure state",
-        DESCRIBE_TYPE_FAILED_RETURN,
-    )
-
-    mock_cfn_client.get_waiter.return_value = mock_waiter
 
     with pytest.raises(DownstreamError):
-        project._wait_for_registration(mock_cfn_client, REGISTRATION_TOKEN, False)
+        project._wait_for_registration(
+            mock_cfn_client, REGISTRATION_TOKEN, False, poller
+        )
 
     mock_cfn_client.describe_type_registration.assert_called_once_with(
         RegistrationToken=REGISTRATION_TOKEN
     )
     mock_cfn_client.set_type_default_version.assert_not_called()
-    mock_waiter.wait.assert_called_once_with(RegistrationToken=REGISTRATION_TOKEN)
 
 
 def test__write_settings_invalid_runtime(project):
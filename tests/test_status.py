@@ -0,0 +1,117 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError, WaiterError
+
+from rpdk.core.cli import main
+from rpdk.core.exceptions import DownstreamError
+from rpdk.core.status import (
+    describe_registration,
+    get_registrations,
+    wait_for_registration,
+)
+from rpdk.core.waiters import AdaptivePoller
+
+BLANK_CLIENT_ERROR = {"Error": {"Code": "", "Message": ""}}
+TYPE_VERSION_ARN = (
+    "arn:aws:cloudformation:us-east-1:123456789012:type/resource/Foo-Bar-Foo/00000001"
+)
+COMPLETE = {"ProgressStatus": "COMPLETE", "TypeVersionArn": TYPE_VERSION_ARN}
+IN_PROGRESS = {"ProgressStatus": "IN_PROGRESS", "Description": "Deploying"}
+FAILED = {"ProgressStatus": "FAILED", "Description": "Failed to deploy"}
+
+
+def test_describe_registration_clienterror():
+    mock_cfn_client = MagicMock(spec=["describe_type_registration"])
+    mock_cfn_client.describe_type_registration.side_effect = ClientError(
+        BLANK_CLIENT_ERROR, "DescribeTypeRegistration"
+    )
+
+    with pytest.raises(DownstreamError):
+        describe_registration(mock_cfn_client, "foo")
+
+
+def test_wait_for_registration_polls_until_complete():
+    mock_cfn_client = MagicMock(spec=["describe_type_registration"])
+    mock_cfn_client.describe_type_registration.side_effect = [
+        IN_PROGRESS,
+        IN_PROGRESS,
+        COMPLETE,
+    ]
+    poller = AdaptivePoller()
+
+    with patch("rpdk.core.waiters.sleep", autospec=True) as mock_sleep:
+        response = wait_for_registration(mock_cfn_client, "foo", poller)
+
+    assert response == COMPLETE
+    assert mock_sleep.call_count == 2
+    assert poller.metrics[0].polls == 3
+
+
+def test_wait_for_registration_failed():
+    mock_cfn_client = MagicMock(spec=["describe_type_registration"])
+    mock_cfn_client.describe_type_registration.return_value = FAILED
+
+    with pytest.raises(WaiterError) as excinfo:
+        wait_for_registration(mock_cfn_client, "foo")
+
+    assert excinfo.value.last_response == FAILED
+
+
+def test_get_registrations_wait_timeout():
+    mock_cfn_client = MagicMock(spec=["describe_type_registration"])
+    mock_cfn_client.describe_type_registration.return_value = IN_PROGRESS
+
+    registrations = get_registrations(
+        mock_cfn_client, ["foo"], AdaptivePoller(timeout=0)
+    )
+
+    assert registrations == {"foo": IN_PROGRESS}
+
+
+def test_get_registrations_deduplicates_tokens():
+    mock_cfn_client = MagicMock(spec=["describe_type_registration"])
+    mock_cfn_client.describe_type_registration.return_value = COMPLETE
+
+    registrations = get_registrations(mock_cfn_client, ["foo", "bar", "foo"])
+
+    assert list(registrations) == ["foo", "bar"]
+    assert mock_cfn_client.describe_type_registration.call_count == 2
+
+
+def _status_and_expect(responses, *args):
+    patch_sdk = patch("rpdk.core.status.create_sdk_session", autospec=True)
+    with patch_sdk as mock_sdk:
+        mock_cfn_client = mock_sdk.return_value.client.return_value
+        mock_cfn_client.describe_type_registration.side_effect = lambda **kwargs: (
+            responses[kwargs["RegistrationToken"]]
+        )
+        main(args_in=["status"] + list(args))
+    return mock_sdk
+
+
+def test_status_command_complete(capsys):
+    mock_sdk = _status_and_expect({"foo": COMPLETE}, "foo", "--region", "us-east-2")
+
+    mock_sdk.assert_called_once_with("us-east-2")
+    out, err = capsys.readouterr()
+    assert not err
+    assert TYPE_VERSION_ARN in out
+
+
+def test_status_command_failed(capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        _status_and_expect({"foo": COMPLETE, "bar": FAILED}, "foo", "bar")
+
+    assert excinfo.value.code == 1
+    out, _err = capsys.readouterr()
+    assert "Failed to deploy" in out
+
+
+def test_status_command_wait_timeout(capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        _status_and_expect({"foo": IN_PROGRESS}, "foo", "--wait", "--timeout", "0")
+
+    assert excinfo.value.code == 1
+    out, _err = capsys.readouterr()
+    assert "Timed out" in out
@@ -22,6 +22,7 @@ from rpdk.core.upload import (
     LOG_DELIVERY_ROLE_ARN_OUTPUT_NAME,
     Uploader,
 )
+from rpdk.core.waiters import AdaptivePoller
 
 from .utils import CONTENTS_UTF8
 
@@ -33,6 +34,7 @@ STACK_ID = (
     + "/f2af5ac0-615a-11e9-b390-0e1ffe4de6a4"
 )
 BLANK_CLIENT_ERROR = {"Error": {"Code": "", "Message": ""}}
+TOKEN = "b1d3f7a2-5bd0-4b8e-a3a3-5c2fb7d1c0de"
 
 
 def describe_stacks_result(outputs):
@@ -60,15 +62,35 @@ def describe_stacks_result(outputs):
     }
 
 
+def describe_stack_events_result(*statuses):
+    """Stack events for the stack itself, newest first, like the API."""
+    return {
+        "StackEvents": [
+            {
+                "StackId": STACK_ID,
+                "EventId": "event-{}".format(len(statuses) - i),
+                "StackName": INFRA_STACK_NAME,
+                "LogicalResourceId": INFRA_STACK_NAME,
+                "PhysicalResourceId": STACK_ID,
+                "ResourceType": "AWS::CloudFormation::Stack",
+                "ResourceStatus": status,
+                "ClientRequestToken": TOKEN,
+            }
+            for i, status in enumerate(statuses)
+        ]
+    }
+
+
 class AlreadyExistsException(Exception):
     pass
 
 
 @pytest.fixture
 def uploader():
-    uploader = Uploader(Mock(), Mock())
+    uploader = Uploader(Mock(), Mock(), AdaptivePoller())
     uploader.cfn_client.exceptions.AlreadyExistsException = AlreadyExistsException
-    return uploader
+    with patch("rpdk.core.waiters.sleep", autospec=True):
+        yield uploader
 
 
 def test__get_template_output_name_mismatched(uploader):
@@ -83,26 +105,87 @@ def test__get_template_output_name_mismatched(uploader):
     )
 
 
-def test__wait_for_stack_failure(uploader):
-    e = WaiterError(
-        name="StackCreateComplete",
-        reason="Waiter encountered a terminal failure state",
-        last_response=None,
+def test__wait_for_stack_events_success(uploader):
+    uploader.cfn_client.describe_stack_events.side_effect = [
+        {"StackEvents": []},
+        describe_stack_events_result("CREATE_IN_PROGRESS"),
+        describe_stack_events_result("CREATE_IN_PROGRESS"),
+        describe_stack_events_result("CREATE_COMPLETE", "CREATE_IN_PROGRESS"),
+    ]
+
+    uploader._wait_for_stack(STACK_ID, "CREATE_COMPLETE", "success-msg", TOKEN)
+
+    assert uploader.cfn_client.describe_stack_events.call_count == 4
+    uploader.cfn_client.describe_stacks.assert_not_called()
+    metrics = uploader.poller.metrics[0]
+    assert metrics.polls == 4
+    assert metrics.elapsed >= metrics.slept > 0
+
+
+def test__wait_for_stack_events_ignores_other_operations(uploader):
+    other = describe_stack_events_result("UPDATE_COMPLETE")
+    for event in other["StackEvents"]:
+        event["ClientRequestToken"] = "other-token"
+    uploader.cfn_client.describe_stack_events.side_effect = [
+        other,
+        describe_stack_events_result("UPDATE_COMPLETE"),
+    ]
+
+    uploader._wait_for_stack(STACK_ID, "UPDATE_COMPLETE", "success-msg", TOKEN)
+
+    assert uploader.cfn_client.describe_stack_events.call_count == 2
+
+
+def test__wait_for_stack_events_failure(uploader):
+    uploader.cfn_client.describe_stack_events.return_value = (
+        describe_stack_events_result("ROLLBACK_COMPLETE")
     )
-    mock_waiter = uploader.cfn_client.get_waiter.return_value
-    mock_waiter.wait.side_effect = e
 
     with pytest.raises(UploadError) as excinfo:
-        uploader._wait_for_stack("stack-foo", "StackCreateComplete", "success-msg")
+        uploader._wait_for_stack(STACK_ID, "CREATE_COMPLETE", "success-msg", TOKEN)
+
+    assert isinstance(excinfo.value.__cause__, WaiterError)
+
+
+def test__wait_for_stack_events_denied_falls_back_to_status(uploader):
+    uploader.cfn_client.describe_stack_events.side_effect = ClientError(
+        BLANK_CLIENT_ERROR, "DescribeStackEvents"
+    )
+    in_progress = describe_stacks_result([])
+    in_progress["Stacks"][0]["StackStatus"] = "CREATE_IN_PROGRESS"
+    uploader.cfn_client.describe_stacks.side_effect = [
+        in_progress,
+        describe_stacks_result([]),
+    ]
+
+    uploader._wait_for_stack(STACK_ID, "CREATE_COMPLETE", "success-msg", TOKEN)
 
-    mock_waiter.wait.assert_called_once_with(StackName="stack-foo", WaiterConfig=ANY)
-    assert excinfo.value.__cause__ is e
+    uploader.cfn_client.describe_stack_events.assert_called_once_with(
+        StackName=STACK_ID
+    )
+    assert uploader.cfn_client.describe_stacks.call_count == 2
 
 
-def test__wait_for_stack_success(uploader):
-    mock_waiter = uploader.cfn_client.get_waiter.return_value
-    uploader._wait_for_stack("stack-foo", "waiter-name", "success-msg")
-    mock_waiter.wait.assert_called_once_with(StackName="stack-foo", WaiterConfig=ANY)
+def test__wait_for_stack_status_failure(uploader):
+    failed = describe_stacks_result([])
+    failed["Stacks"][0]["StackStatus"] = "UPDATE_ROLLBACK_COMPLETE"
+    uploader.cfn_client.describe_stacks.return_value = failed
+
+    with pytest.raises(UploadError) as excinfo:
+        uploader._wait_for_stack("stack-foo", "UPDATE_COMPLETE", "success-msg")
+
+    assert isinstance(excinfo.value.__cause__, WaiterError)
+    uploader.cfn_client.describe_stack_events.assert_not_called()
+
+
+def test__wait_for_stack_timeout(uploader):
+    uploader.poller.timeout = 0
+    uploader.cfn_client.describe_stack_events.return_value = (
+        describe_stack_events_result("CREATE_IN_PROGRESS")
+    )
+
+    with pytest.raises(UploadError):
+        uploader._wait_for_stack(STACK_ID, "CREATE_COMPLETE", "success-msg", TOKEN)
 
 
 def test__get_stack_output_output_found(uploader):
@@ -206,8 +289,9 @@ def test__create_or_update_stack_stack_doesnt_exist(uploader):
         StackName=INFRA_STACK_NAME,
         TemplateBody=CONTENTS_UTF8,
         EnableTerminationProtection=True,
+        ClientRequestToken=ANY,
     )
-    mock_wait.assert_called_once_with(STACK_ID, "stack_create_complete", ANY)
+    mock_wait.assert_called_once_with(STACK_ID, "CREATE_COMPLETE", ANY, ANY)
 
 
 def test__create_or_update_stack_stack_exists_and_no_changes(uploader):
@@ -231,11 +315,13 @@ def test__create_or_update_stack_stack_exists_and_no_changes(uploader):
         StackName=INFRA_STACK_NAME,
         TemplateBody=CONTENTS_UTF8,
         EnableTerminationProtection=True,
+        ClientRequestToken=ANY,
     )
     uploader.cfn_client.update_stack.assert_called_once_with(
         Capabilities=["CAPABILITY_IAM"],
         StackName=INFRA_STACK_NAME,
         TemplateBody=CONTENTS_UTF8,
+        ClientRequestToken=ANY,
     )
 
     mock_wait.assert_not_called()
@@ -255,14 +341,16 @@ def test__create_or_update_stack_stack_exists_and_needs_changes(uploader):
         StackName=INFRA_STACK_NAME,
         TemplateBody=CONTENTS_UTF8,
         EnableTerminationProtection=True,
+        ClientRequestToken=ANY,
     )
     uploader.cfn_client.update_stack.assert_called_once_with(
         Capabilities=["CAPABILITY_IAM"],
         StackName=INFRA_STACK_NAME,
         TemplateBody=CONTENTS_UTF8,
+        ClientRequestToken=ANY,
     )
 
-    mock_wait.assert_called_once_with(STACK_ID, "stack_update_complete", ANY)
+    mock_wait.assert_called_once_with(STACK_ID, "UPDATE_COMPLETE", ANY, ANY)
 
 
 def test__create_or_update_stack_create_unknown_failure(uploader):
@@ -279,6 +367,7 @@ def test__create_or_update_stack_create_unknown_failure(uploader):
         StackName=INFRA_STACK_NAME,
         TemplateBody=CONTENTS_UTF8,
         EnableTerminationProtection=True,
+        ClientRequestToken=ANY,
     )
 
     assert uploader.get_log_delivery_role_arn() == ""
@@ -301,11 +390,13 @@ def test__create_or_update_stack_update_unknown_failure(uploader):
         StackName=INFRA_STACK_NAME,
         TemplateBody=CONTENTS_UTF8,
         EnableTerminationProtection=True,
+        ClientRequestToken=ANY,
     )
     uploader.cfn_client.update_stack.assert_called_once_with(
         Capabilities=["CAPABILITY_IAM"],
         StackName=INFRA_STACK_NAME,
         TemplateBody=CONTENTS_UTF8,
+        ClientRequestToken=ANY,
     )
 
     mock_wait.assert_not_called()
@@ -313,6 +404,9 @@ def test__create_or_update_stack_update_unknown_failure(uploader):
 
 def test_create_or_update_role(uploader):
     uploader.cfn_client.create_stack.return_value = {"StackId": STACK_ID}
+    uploader.cfn_client.describe_stack_events.return_value = (
+        describe_stack_events_result("CREATE_COMPLETE")
+    )
     uploader.cfn_client.describe_stacks.return_value = describe_stacks_result(
         [{"OutputKey": EXECUTION_ROLE_ARN_OUTPUT_NAME, "OutputValue": "bar"}]
     )